@@ -334,8 +334,59 @@ class Score:
         screen.blit(self.image, self.rect)
         
 
+class PostEffect:
+    """
+    画面全体に重ねるエフェクト（ポストエフェクト）に関するクラス
+    オーバーレイSurfaceは起動時に一度だけ生成・変換し，発動中は合成フラグで重ねるだけにする
+    """
+    def __init__(self):
+        """
+        エフェクト名ごとに（オーバーレイSurface, 合成フラグ）のリストを用意する
+        pg.display.set_mode()の後に生成すること
+        """
+        self.imgs = {
+            # 超重力砲：黒の半透明と同じく画面の明るさを半分にする
+            "gravity": [(__class__.fill_surface((128, 128, 128)), pg.BLEND_RGB_MULT)],
+            # EMP：黄色の半透明と同じく明るさを半分にしてから黄色を加える
+            "emp": [(__class__.fill_surface((128, 128, 128)), pg.BLEND_RGB_MULT),
+                    (__class__.fill_surface((127, 127, 0)), pg.BLEND_RGB_ADD)],
+        }
+        self.lifes = {name: 0 for name in self.imgs}  # エフェクトの残り時間
+
+    @staticmethod
+    def fill_surface(color: tuple[int, int, int]) -> pg.Surface:
+        """
+        画面と同じ大きさ・形式の単色Surfaceを生成する
+        引数 color：塗りつぶす色
+        戻り値：画面形式に変換済みのSurface
+        """
+        img = pg.Surface((WIDTH, HEIGHT)).convert()
+        img.fill(color)
+        return img
+
+    def start(self, name: str, life: int):
+        """
+        エフェクトを発動する（Surfaceの生成は行わない）
+        引数1 name：エフェクト名
+        引数2 life：エフェクトを重ねるフレーム数
+        """
+        self.lifes[name] = max(self.lifes[name], life)
+
+    def update(self, screen: pg.Surface):
+        """
+        発動中のエフェクトを画面に重ね，残り時間を1減算する
+        引数 screen：画面Surface
+        """
+        for name, life in self.lifes.items():
+            if life <= 0:
+                continue
+            for img, flag in self.imgs[name]:
+                screen.blit(img, [0, 0], special_flags=flag)
+            self.lifes[name] = life-1
+
+
 class EMP:
-    def __init__(self, enemys:pg.sprite.Group, bombs:pg.sprite.Group, screan:pg.surface):
+    def __init__(self, enemys:pg.sprite.Group, bombs:pg.sprite.Group, post:PostEffect, life: int = 3):
         for enemy in enemys:
             enemy.interval = math.inf
             enemy.image = pg.transform.laplacian(enemy.image)
@@ -343,28 +394,19 @@ class EMP:
         for bomb in bombs:
             bomb.speed = bomb.speed/2
             bomb.state = "inactive"
-        
-        self.image = pg.Surface((WIDTH,HEIGHT))
-        pg.draw.rect(self.image, (255,255,0),(0, 0, WIDTH, HEIGHT))
-        self.image.set_alpha(128)
-        screan.blit(self.image, [0,0])
-        pg.display.update()
-        time.sleep(0.05)
-        pass
+        post.start("emp", life)  # 画面を黄色く光らせる
 
 
 class Gravity(pg.sprite.Sprite):
     """
         超重力砲（超協力重力場）に関するclass
+        発動中は画面上のすべての敵機と爆弾を破壊する
     """
-    def __init__(self, life: int = 400):
+    def __init__(self, post: PostEffect, life: int = 400):
         super().__init__()
 
         self.life = -life
-        self.image = pg.Surface((1600, 900))
-        pg.draw.rect(self.image, (0, 0, 0), (0, 0, 1600, 900))
-        self.image.set_alpha(128)
-        self.rect = self.image.get_rect()
+        post.start("gravity", life)  # 画面を暗くする
 
     def update(self) -> None:
         if self.life >= 0:
@@ -458,6 +500,7 @@ def main():
     #bg_img = pg.image.load(f"{MAIN_DIR}/fig/pg_bg.jpg")
     bg_img = pg.transform.rotozoom(pg.image.load(f"{MAIN_DIR}/fig/pg_bg.jpg"), 0, 3.5)
     score = Score()
+    post = PostEffect()
     stoptime = 0  # こうかとんが動けなくなる時間を格納
     bird = Bird(3, (900, 400))
     bombs = pg.sprite.Group()
@@ -484,7 +527,7 @@ def main():
                 
             if event.type == pg.KEYDOWN and event.key == pg.K_e:
                 if score.value > 20:
-                    EMP(emys, bombs, screen)
+                    EMP(emys, bombs, post)
                     score.value -= 20
 
             # スコアが100を超えたらBossを生成
@@ -502,7 +545,7 @@ def main():
                 score.value -= 100
             
             if event.type == pg.KEYDOWN and event.key == pg.K_RETURN and score.value >= 200:
-                gravitys.add(Gravity())
+                gravitys.add(Gravity(post))
                 score.value -= 200
 
             #100スコアを消費して連続的なビームを打つ
@@ -602,13 +645,16 @@ def main():
                 exps.add(Explosion(bomb, 50))  # 爆発エフェクト
                 score.value += 5
         
-        for emy in pg.sprite.groupcollide(emys, gravitys, True, False).keys():
-            exps.add(Explosion(emy, 100))  # 爆発エフェクト
-            score.value += 10  # 10点アップ
-            bird.change_img(6, screen)  # こうかとん喜びエフェクト
-        for bomb in pg.sprite.groupcollide(bombs, gravitys, True, False).keys():
-            exps.add(Explosion(bomb, 50))  # 爆発エフェクト
-            score.value += 1  # 1点アップ
+        if len(gravitys) > 0:  # 超重力砲の発動中はすべての敵機と爆弾を破壊する
+            for emy in emys.sprites():
+                exps.add(Explosion(emy, 100))  # 爆発エフェクト
+                score.value += 10  # 10点アップ
+                bird.change_img(6, screen)  # こうかとん喜びエフェクト
+            emys.empty()
+            for bomb in bombs.sprites():
+                exps.add(Explosion(bomb, 50))  # 爆発エフェクト
+                score.value += 1  # 1点アップ
+            bombs.empty()
 
         for emy in pg.sprite.groupcollide(emys, conbeams, True, False).keys():
             exps.add(Explosion(emy, 100))  # 爆発エフェクト
@@ -631,7 +677,7 @@ def main():
         exps.update()
         exps.draw(screen)
         gravitys.update()
-        gravitys.draw(screen)
+        post.update(screen)
         conbeams.update()
         conbeams.draw(screen)
         boss.update()  # Bossを更新